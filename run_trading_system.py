@@ -4,174 +4,438 @@ BSE Trading System Manager
 Replaces app_demo.sh and data_fetch_demo.sh with better process management
 """
 
+import errno
+import select
+import shutil
+import socket
 import subprocess
 import sys
 import time
 import signal
 import os
-import yaml
-import requests
-import json
+from enum import IntEnum
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Callable
+
+
+_json_loader: Optional[Callable[[bytes], Any]] = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON with orjson (C-backed) when available, else the stdlib"""
+    global _json_loader
+    if _json_loader is None:
+        # Resolved on first use only, so a missing orjson is not re-searched per call
+        try:
+            from orjson import loads
+        except ImportError:
+            from json import loads
+        _json_loader = loads
+    return _json_loader(data)
+
+
+class QuestDBInstall(IntEnum):
+    """How QuestDB is installed; NOT_FOUND is falsy"""
+    NOT_FOUND = 0
+    BREW = 1     # Only available through brew services
+    DIRECT = 2   # questdb binary on PATH
+
+
+# Typed config sections, holding only the keys this script reads.
+# Plain slotted classes: attribute access without importing dataclasses.
+
+class QuestDBCfg:
+    __slots__ = ('host', 'port', 'http_port', 'postgres_port', 'batch_size')
+
+    def __init__(self, host: str, port: int, http_port: int, postgres_port: int,
+                 batch_size: int):
+        self.host = host
+        self.port = port                    # ILP port for data ingestion
+        self.http_port = http_port          # HTTP port for queries
+        self.postgres_port = postgres_port  # PostgreSQL port for GUI
+        self.batch_size = batch_size
+
+
+class AlphaVantageCfg:
+    __slots__ = ('api_key', 'symbols', 'polling_interval_seconds')
+
+    def __init__(self, api_key: str, symbols: Tuple[str, ...], polling_interval_seconds: int):
+        self.api_key = api_key
+        self.symbols = symbols
+        self.polling_interval_seconds = polling_interval_seconds
+
+
+class AppCfg:
+    __slots__ = ('build_dir', 'pipeline_executable', 'gui_executable', 'log_file')
+
+    def __init__(self, build_dir: str, pipeline_executable: str, gui_executable: str,
+                 log_file: str):
+        self.build_dir = build_dir
+        self.pipeline_executable = pipeline_executable
+        self.gui_executable = gui_executable
+        self.log_file = log_file
+
+
+class BuildCfg:
+    __slots__ = ('type',)
+
+    def __init__(self, type: str):
+        self.type = type
+
+
+class MonitoringCfg:
+    __slots__ = ('health_check_interval', 'max_startup_wait')
+
+    def __init__(self, health_check_interval: float, max_startup_wait: float):
+        self.health_check_interval = health_check_interval
+        self.max_startup_wait = max_startup_wait
+
 
 class TradingSystemManager:
     def __init__(self, config_path: str = "config.yaml"):
         self.config = self._load_config(config_path)
+        self._freeze_config(self.config)
+
+        # Build command lines once with ALL config values (no hardcoded values in C++)
+        self._pipeline_cmd: Tuple[str, ...] = (
+            f"./{self.app.build_dir}/{self.app.pipeline_executable}",
+            self.av.api_key,
+            self.qdb.host,
+            str(self.qdb.port),
+            str(self.qdb.batch_size),
+            str(self.av.polling_interval_seconds),
+            *self.av.symbols,  # Symbols as additional arguments
+        )
+        self._gui_cmd: Tuple[str, ...] = (
+            f"./{self.app.build_dir}/{self.app.gui_executable}",
+            self.qdb.host,
+            str(self.qdb.postgres_port),
+            self.av.api_key,
+        )
+
         self.processes = {}
         self.running = True
+        self._questdb_installed: Optional[QuestDBInstall] = None
+        self._questdb_started = False  # Only stop QuestDB if we launched it
+        self._pgids: Dict[str, int] = {}  # Process groups of children in their own session
+
+        # Keep-alive HTTP connection to QuestDB, opened on first query
+        self._http = None  # http.client.HTTPConnection
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
+        if hasattr(signal, 'SIGHUP'):
+            # Children run in their own sessions and miss the terminal's hangup
+            signal.signal(signal.SIGHUP, self._signal_handler)
 
     def _load_config(self, config_path: str) -> Dict[str, Any]:
-        """Load configuration from YAML file"""
+        """Load configuration from YAML file (cached as JSON keyed by mtime)"""
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            mtime_ns = os.stat(config_path).st_mtime_ns
         except FileNotFoundError:
             print(f"❌ Config file {config_path} not found!")
             sys.exit(1)
+
+        cache = Path(f"{config_path}.{mtime_ns}.json")
+        try:
+            return _json_loads(cache.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+        # Cache miss: only now pay for importing yaml.
+        # Prefer the LibYAML C bindings when available (much faster than pure Python)
+        import yaml
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader
+
+        try:
+            with open(config_path, 'r') as f:
+                config = yaml.load(f, Loader=Loader)
         except yaml.YAMLError as e:
             print(f"❌ Error parsing config file: {e}")
             sys.exit(1)
 
+        self._write_config_cache(config_path, cache, config)
+        return config
+
+    def _freeze_config(self, config: Dict[str, Any]):
+        """Unpack the config dict into typed sections for attribute access"""
+        try:
+            questdb = config['questdb']
+            self.qdb = QuestDBCfg(
+                host=questdb['host'],
+                port=questdb['port'],
+                http_port=questdb['http_port'],
+                postgres_port=questdb['postgres_port'],
+                batch_size=questdb['batch_size'],
+            )
+            alpha_vantage = config['alpha_vantage']
+            self.av = AlphaVantageCfg(
+                api_key=alpha_vantage['api_key'],
+                symbols=tuple(alpha_vantage['symbols']),
+                polling_interval_seconds=alpha_vantage['polling_interval_seconds'],
+            )
+            app = config['app']
+            self.app = AppCfg(
+                build_dir=app['build_dir'],
+                pipeline_executable=app['pipeline_executable'],
+                gui_executable=app['gui_executable'],
+                log_file=app['log_file'],
+            )
+            self.build = BuildCfg(type=config['build']['type'])
+            monitoring = config['monitoring']
+            self.monitoring = MonitoringCfg(
+                health_check_interval=monitoring['health_check_interval'],
+                max_startup_wait=monitoring['max_startup_wait'],
+            )
+        except (KeyError, TypeError) as e:
+            print(f"❌ Invalid config file: {e}")
+            sys.exit(1)
+
+    def _write_config_cache(self, config_path: str, cache: Path, config: Dict[str, Any]):
+        """Write the parsed config sidecar and drop stale ones (best effort)"""
+        import json
+        try:
+            config_file = Path(config_path)
+            for stale in config_file.parent.glob(f"{config_file.name}.*.json"):
+                if stale != cache:
+                    stale.unlink()
+            cache.write_text(json.dumps(config))
+        except (OSError, TypeError, ValueError):
+            pass
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
+        # We may be interrupting the monitor loop's sigtimedwait; unblock
+        # SIGCHLD so the stop commands spawned below don't inherit the mask
+        self._block_sigchld(False)
+        if signum == getattr(signal, 'SIGHUP', None):
+            # The terminal is gone; keep shutdown messages from failing on it
+            sys.stdout = sys.stderr = open(os.devnull, 'w')
         print(f"\n🛑 Shutdown requested (signal {signum})")
         self.running = False
         self.stop_all_processes()
 
-    def check_questdb_installed(self) -> bool:
-        """Check if QuestDB is installed (likely via brew)"""
+    def check_questdb_installed(self) -> QuestDBInstall:
+        """Check how QuestDB is installed (PATH or brew), cached per instance"""
+        if self._questdb_installed is not None:
+            return self._questdb_installed
+
+        if shutil.which('questdb'):
+            self._questdb_installed = QuestDBInstall.DIRECT
+            return self._questdb_installed
+        
         try:
-            result = subprocess.run(['which', 'questdb'], capture_output=True, text=True)
-            if result.returncode == 0:
-                return True
-            
             # Check brew services
             result = subprocess.run(['brew', 'list', 'questdb'], capture_output=True, text=True)
-            return result.returncode == 0
+            found = result.returncode == 0
         except Exception:
-            return False
+            found = False
+        self._questdb_installed = QuestDBInstall.BREW if found else QuestDBInstall.NOT_FOUND
+        return self._questdb_installed
 
-    def start_questdb(self) -> bool:
-        """Start QuestDB service"""
+    def start_questdb(self, wait: bool = True) -> bool:
+        """Start QuestDB service, optionally waiting until it accepts connections"""
         try:
             print("🔄 Starting QuestDB...")
+            install = self.check_questdb_installed()
             
-            # Try to start via brew services first
-            result = subprocess.run(['brew', 'services', 'start', 'questdb'], 
-                                  capture_output=True, text=True)
-            
-            if result.returncode == 0:
+            if install == QuestDBInstall.DIRECT:
+                # questdb is on PATH, no need to go through brew. The launcher
+                # backgrounds the JVM and exits, so only its exit code is known here
+                result = subprocess.run(['questdb', 'start'], 
+                                      capture_output=True, text=True)
+                if result.returncode != 0:
+                    print(f"❌ questdb start failed: {result.stderr.strip()}")
+                    return False
+                self._questdb_started = True
+                print("🔄 QuestDB launched")
+            elif install == QuestDBInstall.BREW:
+                result = subprocess.run(['brew', 'services', 'start', 'questdb'], 
+                                      capture_output=True, text=True)
+                if result.returncode != 0:
+                    print(f"❌ Brew services failed: {result.stderr.strip()}")
+                    return False
+                self._questdb_started = True
                 print("✅ QuestDB started via brew services")
-                # Wait for QuestDB to be ready
-                return self._wait_for_questdb_ready()
             else:
-                print(f"ℹ️  Brew services failed: {result.stderr.strip()}")
-                
-                # Try direct questdb command
-                print("🔄 Trying direct QuestDB startup...")
-                process = subprocess.Popen(['questdb', 'start'], 
-                                         stdout=subprocess.PIPE, 
-                                         stderr=subprocess.PIPE)
-                self.processes['questdb'] = process
+                print("❌ QuestDB is not installed!")
+                return False
                 
-                # Wait for QuestDB to be ready
-                return self._wait_for_questdb_ready()
+            # Wait for QuestDB to be ready
+            return self._wait_for_questdb_ready() if wait else True
                 
         except Exception as e:
             print(f"❌ Failed to start QuestDB: {e}")
             return False
 
-    def _wait_for_questdb_ready(self, timeout: int = 60) -> bool:
-        """Wait for QuestDB to be ready to accept connections"""
+    def _wait_for_questdb_ready(self, timeout: int = 60,
+                                abort: Optional[Callable[[], bool]] = None) -> bool:
+        """Wait for QuestDB to be ready to accept connections, or until abort() is true"""
         print("⏳ Waiting for QuestDB to be ready...")
         
-        for i in range(timeout):
-            if self.check_questdb_running():
+        # A single connect with the whole remaining timeout lets the kernel
+        # wait out slow handshakes; only an immediate refusal (port not
+        # listening yet) brings us back here, to retry with a short backoff
+        delay = 0.05
+        start = time.monotonic()
+        deadline = start + timeout
+        next_report = start + 10
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if abort is not None and abort():
+                return False
+            try:
+                socket.create_connection((self.qdb.host, self.qdb.port), timeout=remaining).close()
                 print("✅ QuestDB is ready!")
                 return True
-            time.sleep(1)
-            if i % 10 == 9:  # Print every 10 seconds
-                print(f"   Still waiting... ({i+1}s)")
+            except socket.gaierror as e:
+                # A host that does not resolve will not start resolving by waiting
+                print(f"❌ Cannot resolve QuestDB host {self.qdb.host}: {e}")
+                return False
+            except OSError:
+                pass  # Refused, unreachable or timed out
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 1.5, 0.2)
+            now = time.monotonic()
+            if now >= next_report:  # Print every 10 seconds
+                print(f"   Still waiting... ({int(now - start)}s)")
+                next_report += 10
         
         print("❌ QuestDB failed to start within timeout")
         return False
 
     def stop_questdb(self):
-        """Stop QuestDB service if we started it"""
-        if 'questdb' in self.processes:
-            print("🛑 Stopping QuestDB...")
-            process = self.processes['questdb']
-            if process and process.poll() is None:
-                process.terminate()
-                try:
-                    process.wait(timeout=10)
-                    print("✅ QuestDB stopped")
-                except subprocess.TimeoutExpired:
-                    print("⚠️  Force killing QuestDB")
-                    process.kill()
+        """Stop QuestDB if we started it, the same way start_questdb launched it"""
+        if not self._questdb_started:
+            return
+        self._questdb_started = False
+
+        install = self.check_questdb_installed()  # Cached by start_questdb
+        if install == QuestDBInstall.DIRECT:
+            cmd = ['questdb', 'stop']
+        elif install == QuestDBInstall.BREW:
+            cmd = ['brew', 'services', 'stop', 'questdb']
         else:
-            # Try to stop via brew services (in case it was started that way)
-            try:
-                subprocess.run(['brew', 'services', 'stop', 'questdb'], 
-                             capture_output=True, text=True)
-            except Exception:
-                pass
+            return
+
+        print("🛑 Stopping QuestDB...")
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                print("✅ QuestDB stopped")
+        except Exception:
+            pass
 
     def check_questdb_running(self) -> bool:
         """Check if QuestDB is running"""
         try:
             # Check if process is running
-            result = subprocess.run(['pgrep', '-f', 'questdb'], 
-                                  capture_output=True, text=True)
-            if result.returncode != 0:
+            if self._find_pid('questdb') is None:
                 return False
                 
-            # Check if ILP port is open (more reliable than HTTP)
-            import socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            result = sock.connect_ex((self.config['questdb']['host'], self.config['questdb']['port']))
-            sock.close()
-            
-            if result == 0:
-                return True
-                
-            # Also check PostgreSQL port
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            result = sock.connect_ex((self.config['questdb']['host'], self.config['questdb']['postgres_port']))
-            sock.close()
-            
-            return result == 0
+            # Probe ILP (more reliable than HTTP) and PostgreSQL ports together
+            return self._any_port_open(
+                self.qdb.host,
+                (self.qdb.port, self.qdb.postgres_port),
+                2.0,
+            )
             
         except Exception:
             return False
 
+    def _any_port_open(self, host: str, ports, timeout: float) -> bool:
+        """Connect to all ports in parallel, return True as soon as one accepts"""
+        pending = {}
+        try:
+            for port in ports:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                err = sock.connect_ex((host, port))
+                if err == 0:
+                    sock.close()
+                    return True
+                if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    pending[sock.fileno()] = sock
+                else:
+                    sock.close()
+
+            deadline = time.monotonic() + timeout
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                _, writable, _ = select.select([], list(pending.values()), [], remaining)
+                for sock in writable:
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        return True
+                    pending.pop(sock.fileno()).close()
+            return False
+        finally:
+            for sock in pending.values():
+                sock.close()
+
     def check_pipeline_running(self) -> Optional[int]:
         """Check if data pipeline is running, return PID if found"""
+        return self._find_pid(self.app.pipeline_executable)
+
+    def _find_pid(self, needle: str) -> Optional[int]:
+        """Return the lowest PID whose command line contains needle (like pgrep -f)"""
+        if not os.path.isdir('/proc'):
+            # No procfs (e.g. macOS), fall back to pgrep
+            try:
+                result = subprocess.run(['pgrep', '-f', needle], 
+                                      capture_output=True, text=True)
+                if result.returncode == 0 and result.stdout.strip():
+                    return int(result.stdout.strip().split('\n')[0])
+            except Exception:
+                pass
+            return None
+
+        # A plain scan: this runs about once per command, so batching the
+        # reads (e.g. through io_uring) would not pay for the extra dependency
+        pattern = needle.encode()
+        own_pid = os.getpid()
+        found = None
         try:
-            result = subprocess.run(['pgrep', '-f', self.config['app']['pipeline_executable']], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0 and result.stdout.strip():
-                return int(result.stdout.strip().split('\n')[0])
-        except Exception:
+            with os.scandir('/proc') as entries:
+                for entry in entries:
+                    if not entry.name.isdigit():
+                        continue
+                    pid = int(entry.name)
+                    if pid == own_pid or (found is not None and pid > found):
+                        continue
+                    try:
+                        fd = os.open(f"/proc/{pid}/cmdline", os.O_RDONLY)
+                    except OSError:
+                        continue  # Process exited or is not accessible
+                    try:
+                        cmdline = os.read(fd, 4096)
+                    except OSError:
+                        continue
+                    finally:
+                        os.close(fd)
+                    # Arguments are NUL-separated; pgrep -f matches them space-joined
+                    if pattern in cmdline.replace(b'\0', b' '):
+                        found = pid
+        except OSError:
             pass
-        return None
+        return found
 
     def build_project(self):
         """Build the C++ project"""
         print("🔨 Building project...")
-        build_dir = self.config['app']['build_dir']
-        build_type = self.config['build']['type']
+        build_dir = self.app.build_dir
+        build_type = self.build.type
         
         try:
             subprocess.run(['cmake', '--build', build_dir, '--config', build_type], 
-                         check=True, cwd='.')
+                         check=True)
             print("✅ Build completed successfully")
         except subprocess.CalledProcessError as e:
             print(f"❌ Build failed: {e}")
@@ -186,31 +450,53 @@ class TradingSystemManager:
 
         print("🔄 Starting Alpha Vantage → QuestDB data pipeline...")
         
-        # Build command with ALL config values (no hardcoded values in C++)
-        cmd = [
-            f"./{self.config['app']['build_dir']}/{self.config['app']['pipeline_executable']}",
-            self.config['alpha_vantage']['api_key'],
-            self.config['questdb']['host'],
-            str(self.config['questdb']['port']),
-            str(self.config['questdb']['batch_size']),
-            str(self.config['alpha_vantage']['polling_interval_seconds']),
-        ]
-        
-        # Add symbols as additional arguments
-        cmd.extend(self.config['alpha_vantage']['symbols'])
-        
-        # Start process
-        log_file = open(self.config['app']['log_file'], 'w')
-        process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT)
+        # Start process; the child gets its own copy of the log fd and its own
+        # session so Ctrl+C reaches us first and we can shut it down gracefully
+        log_fd = os.open(self.app.log_file,
+                         os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+        try:
+            process = subprocess.Popen(self._pipeline_cmd, stdout=log_fd, stderr=subprocess.STDOUT,
+                                       close_fds=True, start_new_session=True)
+        finally:
+            os.close(log_fd)
         
         self.processes['pipeline'] = process
+        self._pgids['pipeline'] = process.pid  # Own session, so pgid == pid
         print(f"✅ Data pipeline started (PID: {process.pid})")
-        print(f"📝 Logs: {self.config['app']['log_file']}")
+        print(f"📝 Logs: {self.app.log_file}")
         
-        # Give it time to initialize
-        time.sleep(3)
+        # Wait until the pipeline reports it is up instead of a fixed sleep
+        timeout = self.monitoring.max_startup_wait
+        if not self._wait_for_pipeline_ready(process, self.app.log_file, timeout):
+            if process.poll() is not None:
+                print(f"❌ Data pipeline exited with code {process.returncode}, check the logs")
+            else:
+                print(f"⚠️  Data pipeline still initializing after {timeout}s")
         return process.pid
 
+    def _wait_for_pipeline_ready(self, process: subprocess.Popen, log_path: str,
+                                 timeout: float) -> bool:
+        """Wait for the pipeline's startup marker to appear in its log file"""
+        marker = b"Pipeline started!"
+        last_size = -1
+        delay = 0.05
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                return False
+            try:
+                size = os.stat(log_path).st_size
+                if size != last_size:
+                    last_size = size
+                    with open(log_path, 'rb') as f:
+                        if marker in f.read():
+                            return True
+            except OSError:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+        return False
+
     def start_gui(self):
         """Start the Qt GUI application"""
         print("🖥️  Launching Qt GUI Application...")
@@ -218,24 +504,21 @@ class TradingSystemManager:
         print("   - Interactive charts for RELIANCE & TCS")
         print("   - Live data updates every 5 seconds")
         
-        cmd = [
-            f"./{self.config['app']['build_dir']}/{self.config['app']['gui_executable']}",
-            self.config['questdb']['host'],
-            str(self.config['questdb']['postgres_port']),
-            self.config['alpha_vantage']['api_key']
-        ]
-        
-        print(f"🔧 Starting GUI with command: {' '.join(cmd)}")
+        print(f"🔧 Starting GUI with command: {' '.join(self._gui_cmd)}")
         
         try:
-            # Start GUI with error capture
-            process = subprocess.Popen(cmd, 
+            # Start GUI with error capture, in its own session (see start_pipeline)
+            process = subprocess.Popen(self._gui_cmd, 
                                      stdout=subprocess.PIPE, 
-                                     stderr=subprocess.PIPE)
+                                     stderr=subprocess.PIPE,
+                                     start_new_session=True)
             self.processes['gui'] = process
+            self._pgids['gui'] = process.pid  # Own session, so pgid == pid
             
-            # Give GUI a moment to start
-            time.sleep(2)
+            # Give GUI up to 2s to start, bailing out early if it exits
+            deadline = time.monotonic() + 2
+            while process.poll() is None and time.monotonic() < deadline:
+                time.sleep(0.05)
             
             # Check if GUI started successfully
             if process.poll() is None:
@@ -259,32 +542,27 @@ class TradingSystemManager:
 
     def display_current_data(self):
         """Display current BSE data from QuestDB"""
-        questdb_url = f"http://{self.config['questdb']['host']}:{self.config['questdb']['http_port']}"
+        # Latest prices and total count in one round-trip: the count is
+        # cross-joined onto each row (no rows means no BSE data, i.e. 0)
+        query = (
+            "SELECT symbol, price, side, timestamp, total FROM "
+            "(SELECT symbol, price, side, timestamp FROM trades WHERE exchange = 'BSE' "
+            "ORDER BY timestamp DESC LIMIT 5) "
+            "CROSS JOIN (SELECT COUNT(*) total FROM trades WHERE exchange = 'BSE') "
+            "ORDER BY timestamp DESC"
+        )
         
         try:
-            # Get total record count
-            count_response = requests.get(
-                f"{questdb_url}/exec?query=SELECT COUNT(*) FROM trades WHERE exchange = 'BSE'",
-                timeout=5
-            )
-            if count_response.status_code == 200:
-                count_data = count_response.json()
-                total_records = count_data.get('dataset', [[0]])[0][0]
+            result = self._questdb_query(query)
+            if result is not None:
+                dataset = result.get('dataset', [])
+                total_records = dataset[0][4] if dataset else 0
                 print(f"📊 Current BSE data in QuestDB:")
                 print(f"   Total BSE records: {total_records}")
-            
-            # Get latest prices
-            prices_response = requests.get(
-                f"{questdb_url}/exec?query=SELECT symbol, price, side, timestamp FROM trades WHERE exchange = 'BSE' ORDER BY timestamp DESC LIMIT 5",
-                timeout=5
-            )
-            if prices_response.status_code == 200:
-                prices_data = prices_response.json()
-                dataset = prices_data.get('dataset', [])
                 if dataset:
                     print("💼 Latest BSE prices:")
                     for row in dataset:
-                        symbol, price, side, timestamp = row
+                        symbol, price, side, timestamp, _ = row
                         print(f"   {symbol}: ₹{price} ({side}) at {timestamp}")
                 else:
                     print("   Loading data...")
@@ -292,23 +570,86 @@ class TradingSystemManager:
         except Exception as e:
             print(f"   Error fetching data: {e}")
 
+    def _questdb_query(self, query: str) -> Optional[Dict[str, Any]]:
+        """Run a query on QuestDB's HTTP /exec endpoint, None on a non-200 reply"""
+        import http.client
+        import urllib.parse
+
+        path = f"/exec?query={urllib.parse.quote(query)}"
+        for attempt in range(2):
+            if self._http is None:
+                self._http = http.client.HTTPConnection(self.qdb.host, self.qdb.http_port, timeout=5)
+            try:
+                self._http.request('GET', path, headers={'Accept-Encoding': 'identity'})
+                response = self._http.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Server closed the idle keep-alive connection, reconnect once
+                self._http.close()
+                self._http = None
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                self._http.close()
+                self._http = None
+                raise
+            return _json_loads(body) if response.status == 200 else None
+
     def stop_all_processes(self):
         """Stop all managed processes including QuestDB if we started it"""
-        for name, process in self.processes.items():
-            if name == 'questdb':
-                continue  # Handle QuestDB separately
-            if process and process.poll() is None:
-                print(f"🛑 Stopping {name} (PID: {process.pid})")
-                process.terminate()
-                try:
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    print(f"⚠️  Force killing {name}")
-                    process.kill()
+        running = {name: process for name, process in self.processes.items()
+                   if process and process.poll() is None}
+
+        # Signal every process group at once, then wait on a shared deadline
+        for name, process in running.items():
+            print(f"🛑 Stopping {name} (PID: {process.pid})")
+            self._signal_group(name, process, signal.SIGTERM)
+
+        deadline = time.monotonic() + 5
+        while running and time.monotonic() < deadline:
+            running = {name: process for name, process in running.items()
+                       if process.poll() is None}
+            if running:
+                time.sleep(0.05)
+
+        for name, process in running.items():
+            print(f"⚠️  Force killing {name}")
+            self._signal_group(name, process, signal.SIGKILL)
+            process.wait()
         
         # Stop QuestDB last
         self.stop_questdb()
 
+    def _signal_group(self, name: str, process: subprocess.Popen, signum: int):
+        """Send signum to the process's group if it has its own, else to the process"""
+        pgid = self._pgids.get(name)
+        try:
+            if pgid is not None:
+                os.killpg(pgid, signum)
+            else:
+                process.send_signal(signum)
+        except ProcessLookupError:
+            pass  # Already gone
+
+    @staticmethod
+    def _block_sigchld(block: bool):
+        """Block SIGCHLD so _wait_for_child_exit can consume it synchronously"""
+        if hasattr(signal, 'sigtimedwait'):
+            how = signal.SIG_BLOCK if block else signal.SIG_UNBLOCK
+            signal.pthread_sigmask(how, {signal.SIGCHLD})
+
+    @staticmethod
+    def _wait_for_child_exit(timeout: float):
+        """Sleep until a child process exits or timeout elapses"""
+        if hasattr(signal, 'sigtimedwait'):
+            # Children are still reaped by Popen.poll(), not here, so exit
+            # statuses of managed processes and subprocess.run calls stay intact
+            signal.sigtimedwait({signal.SIGCHLD}, timeout)
+        else:
+            # No sigtimedwait (e.g. macOS), fall back to plain polling
+            time.sleep(timeout)
+
     def run_complete_demo(self):
         """Run the complete BSE trading system demo"""
         print("🚀 BSE Trading System - Complete Demo")
@@ -316,20 +657,35 @@ class TradingSystemManager:
         print()
 
         # Check and start QuestDB if needed
+        questdb_starting = False
         if not self.check_questdb_running():
             if not self.check_questdb_installed():
                 print("❌ QuestDB is not installed!")
                 print("Please install QuestDB first: brew install questdb")
                 sys.exit(1)
             
-            if not self.start_questdb():
+            if not self.start_questdb(wait=False):
                 print("❌ Failed to start QuestDB!")
                 sys.exit(1)
+            questdb_starting = True
         else:
             print("✅ QuestDB is already running")
 
-        # Build project
-        self.build_project()
+        # Build project while QuestDB warms up
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            build = executor.submit(self.build_project)
+            # Stop waiting as soon as the build fails; build.result() re-raises its exit
+            def build_failed() -> bool:
+                return build.done() and build.exception() is not None
+
+            questdb_ready = (self._wait_for_questdb_ready(abort=build_failed)
+                             if questdb_starting else True)
+            build.result()
+
+        if not questdb_ready:
+            print("❌ Failed to start QuestDB!")
+            sys.exit(1)
 
         # Start pipeline
         self.start_pipeline()
@@ -342,25 +698,31 @@ class TradingSystemManager:
         self.start_gui()
 
         # Keep running and monitoring
+        interval = self.monitoring.health_check_interval
+        reported = set()
+        self._block_sigchld(True)
         try:
             while self.running:
-                time.sleep(self.config['monitoring']['health_check_interval'])
+                # Wake up when a child exits, or every interval at the latest
+                self._wait_for_child_exit(interval)
                 # Basic health check
                 for name, process in list(self.processes.items()):
-                    if name == 'questdb':
-                        continue  # QuestDB managed separately
+                    if name in reported:
+                        continue
                     if process.poll() is not None:
                         print(f"⚠️  Process {name} has stopped")
+                        reported.add(name)
                         
         except KeyboardInterrupt:
             pass
         finally:
+            self._block_sigchld(False)
             self.stop_all_processes()
 
     def run_data_only_demo(self):
         """Run data fetching only (replaces data_fetch_demo.sh)"""
         print("=== Alpha Vantage BSE Data Demo ===")
-        print(f"API Key: {self.config['alpha_vantage']['api_key'][:8]}...")
+        print(f"API Key: {self.av.api_key[:8]}...")
         print()
 
         self.build_project()
@@ -400,13 +762,13 @@ class TradingSystemManager:
             
         elif choice == '2':
             # Data fetching only
-            cmd = [f"./{self.config['app']['build_dir']}/src/engine/ingest/ingest_app",
-                   self.config['alpha_vantage']['api_key']]
+            cmd = [f"./{self.app.build_dir}/src/engine/ingest/ingest_app",
+                   self.av.api_key]
             subprocess.run(cmd)
             
         elif choice == '3':
             # CSV test mode
-            cmd = [f"./{self.config['app']['build_dir']}/src/engine/ingest/ingest_app",
+            cmd = [f"./{self.app.build_dir}/src/engine/ingest/ingest_app",
                    "test_data/sample_ticks.csv", "replay"]
             subprocess.run(cmd)
             